@@ -19,61 +19,62 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database. Participants are kept in insertion-ordered
+# dicts used as sets: O(1) lookups while preserving signup order.
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     "Soccer Team": {
         "description": "Join the school soccer team and compete in matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["lucas@mergington.edu", "ava@mergington.edu"]
+        "participants": dict.fromkeys(["lucas@mergington.edu", "ava@mergington.edu"])
     },
     "Swimming Club": {
         "description": "Improve swimming techniques and participate in competitions",
         "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "mia@mergington.edu"]
+        "participants": dict.fromkeys(["james@mergington.edu", "mia@mergington.edu"])
     },
     "Art Club": {
         "description": "Explore various art mediums including painting and sculpture",
         "schedule": "Fridays, 3:00 PM - 4:30 PM",
         "max_participants": 18,
-        "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
+        "participants": dict.fromkeys(["isabella@mergington.edu", "ethan@mergington.edu"])
     },
     "Drama Club": {
         "description": "Perform in school plays and develop acting skills",
         "schedule": "Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 22,
-        "participants": ["noah@mergington.edu", "charlotte@mergington.edu"]
+        "participants": dict.fromkeys(["noah@mergington.edu", "charlotte@mergington.edu"])
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking through debates",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["william@mergington.edu", "amelia@mergington.edu"]
+        "participants": dict.fromkeys(["william@mergington.edu", "amelia@mergington.edu"])
     },
     "Science Olympiad": {
         "description": "Compete in science and engineering challenges",
         "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
         "max_participants": 20,
-        "participants": ["alexander@mergington.edu", "harper@mergington.edu"]
+        "participants": dict.fromkeys(["alexander@mergington.edu", "harper@mergington.edu"])
     }
 }
 
@@ -85,7 +86,11 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    # Serialize each participant dict as a list in signup order
+    return {
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -103,7 +108,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -122,5 +127,5 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student not signed up for this activity")
 
     # Remove student
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
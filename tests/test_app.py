@@ -6,83 +6,117 @@ This module contains comprehensive tests for all API endpoints including:
 - Activities listing
 - Activity signup
 - Activity unregistration
+
+State isolation between tests is handled by the autouse ``reset_activities``
+fixture alone, so the tests need no per-test process forking (e.g.
+``--forked``). If subprocess isolation is ever needed to enforce timeouts,
+scope it to the ``e2e`` marker rather than the whole module.
 """
 
+import copy
+from urllib.parse import quote
+
 import pytest
+from fastapi import HTTPException
+from fastapi.responses import RedirectResponse
 from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import (
+    activities,
+    app,
+    signup_for_activity,
+    unregister_from_activity,
+)
+
+
+# Snapshot of the app's initial activities, taken once at import before any
+# test has mutated them, and restored before each test
+_ORIGINAL_ACTIVITIES = copy.deepcopy(activities)
+
+# Activities the app is expected to offer
+_EXPECTED_NAMES = frozenset({
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+    "Soccer Team",
+    "Swimming Club",
+    "Art Club",
+    "Drama Club",
+    "Debate Team",
+    "Science Olympiad",
+})
+
+# Activity names the tests use that do not exist in the app
+_UNKNOWN_ACTIVITIES = ["Nonexistent Club", "chess club"]
+
+# URL-encoded endpoint paths, built once per activity name
+_SIGNUP_URL = {
+    name: f"/activities/{quote(name)}/signup"
+    for name in [*_ORIGINAL_ACTIVITIES, *_UNKNOWN_ACTIVITIES]
+}
+_UNREGISTER_URL = {
+    name: f"/activities/{quote(name)}/unregister"
+    for name in [*_ORIGINAL_ACTIVITIES, *_UNKNOWN_ACTIVITIES]
+}
+
+# (activity, email, expected_status, expected_detail) for POST signup;
+# a detail of None means the request succeeds
+_SIGNUP_CASES = [
+    pytest.param("Chess Club", "newstudent@mergington.edu", 200, None,
+                 id="existing-activity"),
+    pytest.param("Nonexistent Club", "student@mergington.edu", 404,
+                 "Activity not found", id="nonexistent-activity"),
+    pytest.param("Science Olympiad", "scientist@mergington.edu", 200, None,
+                 id="spaces-in-activity-name"),
+]
+
+# (activity, email, expected_status, expected_detail) for DELETE unregister
+_UNREGISTER_CASES = [
+    pytest.param("Chess Club", "michael@mergington.edu", 200, None,
+                 id="existing-activity"),
+    pytest.param("Nonexistent Club", "student@mergington.edu", 404,
+                 "Activity not found", id="nonexistent-activity"),
+    pytest.param("Science Olympiad", "alexander@mergington.edu", 200, None,
+                 id="spaces-in-activity-name"),
+]
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client shared by the whole test session
 
+    Entering the client once keeps a single event-loop portal (and the app
+    lifespan) open for the session instead of starting one per request.
+    """
+    with TestClient(app) as client:
+        yield client
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application"""
-    return TestClient(app)
+
+def _restore_activities():
+    """Clear and restore activities from a fresh copy of the snapshot"""
+    activities.clear()
+    activities.update(copy.deepcopy(_ORIGINAL_ACTIVITIES))
+
+
+@pytest.fixture(scope="class")
+def activities_response(client):
+    """Fetch the GET /activities payload once for a whole test class
+
+    Class-scoped fixtures run before the function-scoped reset, so the
+    initial state is restored here before the request.
+    """
+    _restore_activities()
+    return client.get("/activities").json()
 
 
 @pytest.fixture(autouse=True)
 def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Soccer Team": {
-            "description": "Join the school soccer team and compete in matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["lucas@mergington.edu", "ava@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Improve swimming techniques and participate in competitions",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "mia@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore various art mediums including painting and sculpture",
-            "schedule": "Fridays, 3:00 PM - 4:30 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu", "ethan@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in school plays and develop acting skills",
-            "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 22,
-            "participants": ["noah@mergington.edu", "charlotte@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking through debates",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["william@mergington.edu", "amelia@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in science and engineering challenges",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["alexander@mergington.edu", "harper@mergington.edu"]
-        }
-    }
-    
-    # Clear and restore activities
-    activities.clear()
-    activities.update(original_activities)
+    """Reset activities data before each test
+
+    When run with pytest-xdist, each worker process imports its own copy of
+    ``app`` and ``activities``, so tests from this module can be spread
+    across workers and each reset only touches that worker's state.
+    """
+    _restore_activities()
     yield
 
 
@@ -95,6 +129,14 @@ class TestRootEndpoint:
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
+    def test_root_route_returns_redirect(self):
+        """Test the root route's endpoint directly, without a request"""
+        route = next(r for r in app.routes if getattr(r, "path", None) == "/")
+        response = route.endpoint()
+        assert isinstance(response, RedirectResponse)
+        assert response.status_code == 307
+        assert response.headers["location"] == "/static/index.html"
+
 
 class TestGetActivities:
     """Tests for the GET /activities endpoint"""
@@ -104,154 +146,121 @@ class TestGetActivities:
         response = client.get("/activities")
         assert response.status_code == 200
 
-    def test_get_activities_returns_all_activities(self, client):
+    def test_get_activities_returns_all_activities(self, activities_response):
         """Test that GET /activities returns all available activities"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        assert len(data) == 9
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Gym Class" in data
-        assert "Soccer Team" in data
-        assert "Swimming Club" in data
-        assert "Art Club" in data
-        assert "Drama Club" in data
-        assert "Debate Team" in data
-        assert "Science Olympiad" in data
-
-    def test_get_activities_returns_correct_structure(self, client):
+        assert _EXPECTED_NAMES <= activities_response.keys()
+        assert len(activities_response) == len(_EXPECTED_NAMES)
+
+    @pytest.mark.parametrize("name", list(_ORIGINAL_ACTIVITIES))
+    def test_get_activities_returns_correct_structure(self, activities_response, name):
         """Test that each activity has the correct data structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        chess_club = data["Chess Club"]
-        assert "description" in chess_club
-        assert "schedule" in chess_club
-        assert "max_participants" in chess_club
-        assert "participants" in chess_club
-        assert isinstance(chess_club["participants"], list)
-
-    def test_get_activities_includes_participants(self, client):
+        activity = activities_response[name]
+        assert "description" in activity
+        assert "schedule" in activity
+        assert "max_participants" in activity
+        assert "participants" in activity
+        assert isinstance(activity["participants"], list)
+
+    @pytest.mark.parametrize("name", list(_ORIGINAL_ACTIVITIES))
+    def test_get_activities_includes_participants(self, activities_response, name):
         """Test that activities include their current participants"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        chess_club = data["Chess Club"]
-        assert "michael@mergington.edu" in chess_club["participants"]
-        assert "daniel@mergington.edu" in chess_club["participants"]
+        participants = activities_response[name]["participants"]
+        assert participants == list(_ORIGINAL_ACTIVITIES[name]["participants"])
 
 
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_for_existing_activity(self, client):
-        """Test successful signup for an existing activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 200
-        assert response.json() == {
-            "message": "Signed up newstudent@mergington.edu for Chess Club"
-        }
+    @pytest.mark.parametrize(
+        "activity, email, expected_status, expected_detail", _SIGNUP_CASES
+    )
+    def test_signup(self, client, activity, email, expected_status, expected_detail):
+        """Test signup responses for valid and invalid requests"""
+        response = client.post(_SIGNUP_URL[activity], params={"email": email})
+
+        assert response.status_code == expected_status
+        if expected_detail is None:
+            assert response.content == (
+                f'{{"message":"Signed up {email} for {activity}"}}'.encode()
+            )
+        else:
+            assert response.json()["detail"] == expected_detail
+
+    def test_signup_duplicate_email(self):
+        """Test that the signup handler rejects a student already signed up"""
+        with pytest.raises(HTTPException) as exc_info:
+            signup_for_activity("Chess Club", "michael@mergington.edu")
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Student already signed up for this activity"
 
     def test_signup_adds_participant_to_activity(self, client):
         """Test that signup actually adds the participant to the activity"""
         email = "newstudent@mergington.edu"
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        client.post(_SIGNUP_URL["Chess Club"], params={"email": email})
         
         # Verify the participant was added
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Chess Club"]["participants"]
-
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test that signing up for a non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-
-    def test_signup_duplicate_email(self, client):
-        """Test that signing up twice with the same email returns 400"""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.post(f"/activities/Chess Club/signup?email={email}")
-        
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Student already signed up for this activity"
+        assert email in activities["Chess Club"]["participants"]
 
+    @pytest.mark.e2e
     def test_signup_multiple_activities(self, client):
         """Test that a student can sign up for multiple different activities"""
         email = "multisport@mergington.edu"
         
         # Sign up for Chess Club
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
+        response1 = client.post(_SIGNUP_URL["Chess Club"], params={"email": email})
         assert response1.status_code == 200
         
         # Sign up for Programming Class
-        response2 = client.post(f"/activities/Programming Class/signup?email={email}")
+        response2 = client.post(_SIGNUP_URL["Programming Class"], params={"email": email})
         assert response2.status_code == 200
         
         # Verify both signups
-        response = client.get("/activities")
-        data = response.json()
-        assert email in data["Chess Club"]["participants"]
-        assert email in data["Programming Class"]["participants"]
-
-    def test_signup_with_spaces_in_activity_name(self, client):
-        """Test signup works correctly with activity names containing spaces"""
-        response = client.post(
-            "/activities/Science Olympiad/signup?email=scientist@mergington.edu"
-        )
-        assert response.status_code == 200
+        assert email in activities["Chess Club"]["participants"]
+        assert email in activities["Programming Class"]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_from_existing_activity(self, client):
-        """Test successful unregistration from an activity"""
-        email = "michael@mergington.edu"  # Already in Chess Club
-        response = client.delete(f"/activities/Chess Club/unregister?email={email}")
-        
-        assert response.status_code == 200
-        assert response.json() == {
-            "message": f"Unregistered {email} from Chess Club"
-        }
+    @pytest.mark.parametrize(
+        "activity, email, expected_status, expected_detail", _UNREGISTER_CASES
+    )
+    def test_unregister(self, client, activity, email, expected_status, expected_detail):
+        """Test unregister responses for valid and invalid requests"""
+        response = client.delete(_UNREGISTER_URL[activity], params={"email": email})
+
+        assert response.status_code == expected_status
+        if expected_detail is None:
+            assert response.content == (
+                f'{{"message":"Unregistered {email} from {activity}"}}'.encode()
+            )
+        else:
+            assert response.json()["detail"] == expected_detail
+
+    def test_unregister_not_signed_up(self):
+        """Test that the unregister handler rejects a student not signed up"""
+        with pytest.raises(HTTPException) as exc_info:
+            unregister_from_activity("Chess Club", "notsignedup@mergington.edu")
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Student not signed up for this activity"
 
     def test_unregister_removes_participant(self, client):
         """Test that unregister actually removes the participant from the activity"""
         email = "michael@mergington.edu"
-        client.delete(f"/activities/Chess Club/unregister?email={email}")
+        client.delete(_UNREGISTER_URL["Chess Club"], params={"email": email})
         
         # Verify the participant was removed
-        response = client.get("/activities")
-        data = response.json()
-        assert email not in data["Chess Club"]["participants"]
-
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test that unregistering from a non-existent activity returns 404"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert response.json()["detail"] == "Activity not found"
-
-    def test_unregister_not_signed_up(self, client):
-        """Test that unregistering when not signed up returns 400"""
-        email = "notsignedup@mergington.edu"
-        response = client.delete(f"/activities/Chess Club/unregister?email={email}")
-        
-        assert response.status_code == 400
-        assert response.json()["detail"] == "Student not signed up for this activity"
+        assert email not in activities["Chess Club"]["participants"]
 
+    @pytest.mark.e2e
     def test_signup_and_unregister_flow(self, client):
         """Test complete flow of signing up and then unregistering"""
         email = "flowtest@mergington.edu"
         
         # Sign up
-        signup_response = client.post(f"/activities/Drama Club/signup?email={email}")
+        signup_response = client.post(_SIGNUP_URL["Drama Club"], params={"email": email})
         assert signup_response.status_code == 200
         
         # Verify signed up
@@ -259,19 +268,13 @@ class TestUnregisterFromActivity:
         assert email in activities_response.json()["Drama Club"]["participants"]
         
         # Unregister
-        unregister_response = client.delete(f"/activities/Drama Club/unregister?email={email}")
+        unregister_response = client.delete(_UNREGISTER_URL["Drama Club"], params={"email": email})
         assert unregister_response.status_code == 200
         
         # Verify unregistered
         activities_response = client.get("/activities")
         assert email not in activities_response.json()["Drama Club"]["participants"]
 
-    def test_unregister_with_spaces_in_activity_name(self, client):
-        """Test unregister works correctly with activity names containing spaces"""
-        email = "alexander@mergington.edu"  # Already in Science Olympiad
-        response = client.delete(f"/activities/Science Olympiad/unregister?email={email}")
-        assert response.status_code == 200
-
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios"""
@@ -279,7 +282,7 @@ class TestEdgeCases:
     def test_activity_names_are_case_sensitive(self, client):
         """Test that activity names are case-sensitive"""
         response = client.post(
-            "/activities/chess club/signup?email=test@mergington.edu"
+            _SIGNUP_URL["chess club"], params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 404
 
@@ -293,7 +296,26 @@ class TestEdgeCases:
 
     def test_empty_email_parameter(self, client):
         """Test behavior with empty email parameter"""
-        response = client.post("/activities/Chess Club/signup?email=")
+        response = client.post(_SIGNUP_URL["Chess Club"], params={"email": ""})
         # FastAPI will accept empty string, but our app should handle it
         # The behavior depends on business requirements
         assert response.status_code in [200, 400, 422]
+
+
+class TestPerformance:
+    """Benchmarks for hot API paths"""
+
+    def test_signup_perf(self, benchmark, client):
+        """Benchmark signup, excluding the participant reset from timings"""
+        email = "benchmark@mergington.edu"
+        participants = activities["Chess Club"]["participants"]
+
+        response = benchmark.pedantic(
+            client.post,
+            args=(_SIGNUP_URL["Chess Club"],),
+            kwargs={"params": {"email": email}},
+            setup=lambda: participants.pop(email, None),
+            rounds=200,
+            iterations=1,
+        )
+        assert response.status_code == 200